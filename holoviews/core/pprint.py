@@ -13,6 +13,9 @@ your data.
 
 import re
 import textwrap
+import weakref
+
+from functools import lru_cache
 
 import param
 
@@ -22,6 +25,76 @@ from param.parameterized import bothmethod
 from .util import group_sanitizer, label_sanitizer
 
 
+@lru_cache(maxsize=256)
+def _compile(pattern, flags=0):
+    "Compile and cache a user supplied regular expression pattern"
+    return re.compile(pattern, flags)
+
+
+def _strip_ansi(string):
+    """
+    Strip ANSI escape sequences from a string, equivalent to
+    InfoPrinter.ansi_escape.sub('', string) but scanning with str.find.
+    """
+    out, i = [], 0
+    while True:
+        j = string.find('\x1b', i)
+        if j < 0:
+            break
+        k = string.find('m', j+1)
+        if k < 0:
+            break
+        out.append(string[i:j])
+        i = k+1
+    out.append(string[i:])
+    return ''.join(out)
+
+
+_Store, _Options = None, None
+
+def _get_store():
+    """
+    Return the Store and Options classes, importing them on first use
+    to avoid a circular import with the options module.
+    """
+    global _Store, _Options
+    if _Store is None:
+        from .options import Store, Options
+        _Store, _Options = Store, Options
+    return _Store, _Options
+
+
+# Node kind used by PrettyPrinter.node_info, weakly keyed by node type
+_KIND_CACHE = weakref.WeakKeyDictionary()
+
+def _node_kind(node):
+    """
+    Return the PrettyPrinter kind of the supplied node. The attributes
+    are probed on the first instance of each type since AttrTree only
+    sets children on the instance.
+    """
+    node_type = type(node)
+    kind = _KIND_CACHE.get(node_type)
+    if kind is None:
+        if hasattr(node, 'children'):
+            kind = 'tree'
+        elif hasattr(node, 'main'):
+            kind = 'adjoint'
+        elif getattr(node, '_deep_indexable', False):
+            kind = 'ndmapping'
+        elif hasattr(node, 'unit_format'):
+            kind = 'dimension'
+        else:
+            kind = 'element'
+        _KIND_CACHE[node_type] = kind
+    return kind
+
+
+@lru_cache(maxsize=32)
+def _text_wrapper(width, indent):
+    "Return a cached TextWrapper for the supplied width and indent"
+    return textwrap.TextWrapper(width=width, subsequent_indent=indent)
+
 
 class ParamFilter(param.ParameterizedFunction):
     """
@@ -42,19 +115,24 @@ class ParamFilter(param.ParameterizedFunction):
         if filter_fn is None:
             return obj
 
+        params = obj.param.objects('existing')
+        matching = {k:v for k,v in params.items() if filter_fn(k,v)}
+        # Instances always go through the proxy so constant parameters
+        # consistently show their class defaults
+        if isinstance(obj, type) and len(matching) == len(params):
+            return obj
+
         name = obj.__name__ if isinstance(obj,type) else obj.__class__.__name__
-        class_proxy = type(name, (param.Parameterized,),
-                      {k:v for k,v in obj.param.objects('existing').items()
-                       if filter_fn(k,v)})
+        class_proxy = type(name, (param.Parameterized,), matching)
 
         if isinstance(obj,type):
             return class_proxy
         else:
             instance_params = obj.param.values().items()
             obj_proxy = class_proxy()
+            proxy_params = obj_proxy.param.objects('existing')
             filtered = {k:v for k,v in instance_params
-                        if (k in obj_proxy.param)
-                            and not obj_proxy.param.objects('existing')[k].constant}
+                        if (k in proxy_params) and not proxy_params[k].constant}
             obj_proxy.param.update(**filtered)
             return obj_proxy
 
@@ -64,12 +142,13 @@ class ParamFilter(param.ParameterizedFunction):
         Builds a parameter filter using the supplied pattern (may be a
         general Python regular expression)
         """
+        regexp = _compile(pattern)
         def inner_filter(name, p):
-            name_match = re.search(pattern,name)
+            name_match = regexp.search(name)
             if name_match is not None:
                 return True
             if p.doc is not None:
-                doc_match = re.search(pattern,p.doc)
+                doc_match = regexp.search(p.doc)
                 if doc_match is not None:
                     return True
             return False
@@ -83,6 +162,8 @@ class InfoPrinter:
     """
     headings = ['\x1b[1;35m%s\x1b[0m', '\x1b[1;32m%s\x1b[0m']
     ansi_escape = re.compile(r'\x1b[^m]*m')
+    sgr_run = re.compile(r'(?:\x1b\[[0-9;]*m){2,}')
+    sgr_params = re.compile(r'\x1b\[([0-9;]*)m')
     ppager = ParamPager()
     store = None
     elements = []
@@ -101,14 +182,23 @@ class InfoPrinter:
         param_info = cls.ppager.get_param_info(obj)
         param_list = cls.ppager.param_docstrings(param_info)
         if not show_values:
-            retval = cls.ansi_escape.sub('', param_list) if not ansi else param_list
+            retval = _strip_ansi(param_list) if not ansi else param_list
             return cls.highlight(pattern, retval)
         else:
             info = cls.ppager(obj)
             if ansi is False:
-                info = cls.ansi_escape.sub('', info)
+                info = _strip_ansi(info)
             return cls.highlight(pattern, info)
 
+    @classmethod
+    def _collapse_sgr(cls, string):
+        """
+        Merge runs of adjacent ANSI SGR escape sequences into a single
+        sequence with the combined parameters.
+        """
+        return cls.sgr_run.sub(
+            lambda m: f"\x1b[{';'.join(cls.sgr_params.findall(m.group(0)))}m", string)
+
     @classmethod
     def heading(cls, heading_text, char='=', level=0, ansi=False):
         """
@@ -126,8 +216,7 @@ class InfoPrinter:
     @classmethod
     def highlight(cls, pattern, string):
         if pattern is None: return string
-        return re.sub(pattern, '\033[43;1;30m\\g<0>\x1b[0m',
-                      string, flags=re.IGNORECASE)
+        return _compile(pattern, re.IGNORECASE).sub('\033[43;1;30m\\g<0>\x1b[0m', string)
 
 
     @classmethod
@@ -138,7 +227,6 @@ class InfoPrinter:
         color codes may be enabled or disabled.
         """
         cls.elements = elements
-        ansi_escape = re.compile(r'\x1b[^m]*m')
 
         isclass = isinstance(obj, type)
         name = obj.__name__ if isclass  else obj.__class__.__name__
@@ -156,8 +244,9 @@ class InfoPrinter:
                     return (f'No {name!r} parameters found matching specified pattern {pattern!r}')
             info = param.ipython.ParamPager()(obj)
             if ansi is False:
-                info = ansi_escape.sub('', info)
-            return cls.highlight(pattern, info)
+                info = _strip_ansi(info)
+            info = cls.highlight(pattern, info)
+            return cls._collapse_sgr(info) if ansi else info
 
         heading = name if isclass else f'{name}: {obj.group} {obj.label}'
         prefix = heading
@@ -167,7 +256,8 @@ class InfoPrinter:
             lines += ['', cls.target_info(obj, ansi=ansi)]
         if plot_class is not None:
             lines += ['', cls.options_info(plot_class, ansi, pattern=pattern)]
-        return "\n".join(lines)
+        info = "\n".join(lines)
+        return cls._collapse_sgr(info) if ansi else info
 
     @classmethod
     def get_target(cls, obj):
@@ -182,10 +272,12 @@ class InfoPrinter:
     def target_info(cls, obj, ansi=False):
         if isinstance(obj, type): return ''
 
-        targets = obj.traverse(cls.get_target)
-        elements, containers = zip(*targets)
-        element_set = {el for el in elements if el is not None}
-        container_set = {c for c in containers if c is not None}
+        element_set, container_set = set(), set()
+        for element, container in obj.traverse(cls.get_target):
+            if element is not None:
+                element_set.add(element)
+            else:
+                container_set.add(container)
 
         element_info = None
         if len(element_set) == 1:
@@ -221,11 +313,10 @@ class InfoPrinter:
         link = url.format(obj=name, backend=backend)
 
         link = None if element and (name not in cls.elements) else link
-        msg = ("\nOnline example: {link}" if link else ''
-               + "\nHelp for the data object: holoviews.help({obj})"
-               + " or holoviews.help(<{lower}_instance>)")
-
-        return '\n'.join([msg.format(obj=name, lower=name.lower(), link=link)])
+        lines = [f'Online example: {link}'] if link else []
+        lines.append(f'Help for the data object: holoviews.help({name})'
+                     f' or holoviews.help(<{name.lower()}_instance>)')
+        return '\n' + '\n'.join(lines)
 
 
     @classmethod
@@ -272,14 +363,14 @@ class PrettyPrinter(param.Parameterized):
 
     @bothmethod
     def pprint(cls_or_slf, node):
-        return cls_or_slf.serialize(cls_or_slf.recurse(node))
+        # Options looked up during this call, shared between nodes
+        option_cache = {} if cls_or_slf.show_options else None
+        return cls_or_slf.serialize(cls_or_slf.recurse(node, option_cache=option_cache))
 
     @bothmethod
     def serialize(cls_or_slf, lines):
-        accumulator = []
-        for level, line in lines:
-            accumulator.append((level *cls_or_slf.tab) + line)
-        return "\n".join(accumulator)
+        tab = cls_or_slf.tab
+        return "\n".join([(level * tab) + line for level, line in lines])
 
     @bothmethod
     def shift(cls_or_slf, lines, shift=0):
@@ -293,51 +384,75 @@ class PrettyPrinter(param.Parameterized):
     def component_type(cls_or_slf, node):
         "Return the type.group.label dotted information"
         if node is None: return ''
-        return cls_or_slf.type_formatter.format(type=str(type(node).__name__))
+        type_formatter = cls_or_slf.type_formatter
+        if type_formatter == ':{type}':
+            return ':' + type(node).__name__
+        return type_formatter.format(type=str(type(node).__name__))
 
     @bothmethod
-    def recurse(cls_or_slf, node, attrpath=None, attrpaths=[], siblings=[], level=0, value_dims=True):
+    def recurse(cls_or_slf, node, attrpath=None, attrpaths=[], siblings=[], level=0,
+                value_dims=True, padding=None, option_cache=None):
         """
-        Recursive function that builds up an ASCII tree given an
-        AttrTree node.
+        Builds up an ASCII tree given an AttrTree node, walking the
+        tree depth-first with an explicit stack rather than recursing
+        into each child. The option_cache dictionary, if supplied, is
+        used to share option lookups between nodes.
         """
-        level, lines = cls_or_slf.node_info(node, attrpath, attrpaths, siblings, level, value_dims)
-        attrpaths = ['.'.join(k) for k in node.keys()] if  hasattr(node, 'children') else []
-        siblings = [node.get(child) for child in attrpaths]
-        for attrpath in attrpaths:
-            lines += cls_or_slf.recurse(node.get(attrpath), attrpath, attrpaths=attrpaths,
-                                 siblings=siblings, level=level+1, value_dims=value_dims)
-        return lines
+        out = []
+        stack = [(node, attrpath, attrpaths, siblings, level, padding)]
+        while stack:
+            node, attrpath, attrpaths, siblings, level, padding = stack.pop()
+            level, lines = cls_or_slf.node_info(node, attrpath, attrpaths, siblings, level,
+                                                value_dims, padding=padding,
+                                                option_cache=option_cache)
+            out += lines
+            attrpaths = ['.'.join(k) for k in node.keys()] if _node_kind(node) == 'tree' else []
+            siblings = [node.get(child) for child in attrpaths]
+            padding = max((len(p) for p in attrpaths), default=0)
+            # Push in reverse so children are visited in their original order
+            for attrpath, child in reversed(list(zip(attrpaths, siblings))):
+                stack.append((child, attrpath, attrpaths, siblings, level+1, padding))
+        return out
 
     @bothmethod
-    def node_info(cls_or_slf, node, attrpath, attrpaths, siblings, level, value_dims):
+    def node_info(cls_or_slf, node, attrpath, attrpaths, siblings, level, value_dims,
+                  padding=None, option_cache=None):
         """
-        Given a node, return relevant information.
+        Given a node, return relevant information. The padding of the
+        attribute path prefix is computed from the attrpaths unless
+        supplied.
         """
         opts = None
-        if hasattr(node, 'children'):
+        show_options = cls_or_slf.show_options
+        kind = _node_kind(node)
+        if kind == 'tree':
             (lvl, lines) = (level, [(level, cls_or_slf.component_type(node))])
-            opts = cls_or_slf.option_info(node)
-        elif hasattr(node, 'main'):
-            (lvl, lines) = cls_or_slf.adjointlayout_info(node, siblings, level, value_dims)
-        elif getattr(node, '_deep_indexable', False):
-            (lvl, lines) = cls_or_slf.ndmapping_info(node, siblings, level, value_dims)
-        elif hasattr(node, 'unit_format'):
+            opts = (cls_or_slf.option_info(node, option_cache=option_cache)
+                    if show_options else None)
+        elif kind == 'adjoint':
+            (lvl, lines) = cls_or_slf.adjointlayout_info(node, siblings, level, value_dims,
+                                                         option_cache=option_cache)
+        elif kind == 'ndmapping':
+            (lvl, lines) = cls_or_slf.ndmapping_info(node, siblings, level, value_dims,
+                                                     option_cache=option_cache)
+        elif kind == 'dimension':
             (lvl, lines) = level, [(level, repr(node))]
         else:
             (lvl, lines) = cls_or_slf.element_info(node, siblings, level, value_dims)
-            opts = cls_or_slf.option_info(node)
+            opts = (cls_or_slf.option_info(node, option_cache=option_cache)
+                    if show_options else None)
 
         # The attribute indexing path acts as a prefix (if applicable)
         if attrpath is not None:
-            padding = cls_or_slf.padding(attrpaths)
+            if padding is None:
+                padding = cls_or_slf.padding(attrpaths)
             (fst_lvl, fst_line) = lines[0]
             line = '.'+attrpath.ljust(padding) +' ' + fst_line
             lines[0] = (fst_lvl, line)
         else:
             fst_lvl = level
 
-        if cls_or_slf.show_options and opts and opts.kwargs:
+        if show_options and opts and opts.kwargs:
             lines += [(fst_lvl, l) for l in cls_or_slf.format_options(opts)]
         return (lvl, lines)
 
@@ -347,22 +462,30 @@ class PrettyPrinter(param.Parameterized):
         Return the information summary for an Element. This consists
         of the dotted name followed by an value dimension names.
         """
-        info = cls_or_slf.component_type(node)
-        if len(node.kdims) >= 1:
-            info += cls_or_slf.tab + f"[{','.join(d.name for d in node.kdims)}]"
-        if value_dims and len(node.vdims) >= 1:
-            info += cls_or_slf.tab + f"({','.join(d.name for d in node.vdims)})"
-        return level, [(level, info)]
+        tab = cls_or_slf.tab
+        parts = [cls_or_slf.component_type(node)]
+        kdims, vdims = node.kdims, node.vdims
+        if kdims:
+            parts.append(f"{tab}[{','.join([d.name for d in kdims])}]")
+        if value_dims and vdims:
+            parts.append(f"{tab}({','.join([d.name for d in vdims])})")
+        return level, [(level, ''.join(parts))]
 
     @bothmethod
-    def option_info(cls_or_slf, node):
+    def option_info(cls_or_slf, node, option_cache=None):
         if not cls_or_slf.show_options:
             return None
-        from .options import Store, Options
+        Store, Options = _get_store()
         options = {}
+        backend, defaults = Store.current_backend, cls_or_slf.show_defaults
         for g in Options._option_groups:
-            gopts = Store.lookup_options(Store.current_backend, node, g,
-                                         defaults=cls_or_slf.show_defaults)
+            key = (type(node), node.group, node.label, node.id, g, backend, defaults)
+            if option_cache is not None and key in option_cache:
+                gopts = option_cache[key]
+            else:
+                gopts = Store.lookup_options(backend, node, g, defaults=defaults)
+                if option_cache is not None:
+                    option_cache[key] = gopts
             if gopts:
                 options.update(gopts.kwargs)
         opts = Options(**{k:v for k,v in options.items() if k != 'backend'})
@@ -372,38 +495,41 @@ class PrettyPrinter(param.Parameterized):
     def format_options(cls_or_slf, opts, wrap_count=100):
         opt_repr = str(opts)
         cls_name = type(opts).__name__
-        indent = ' '*(len(cls_name)+1)
-        wrapper = textwrap.TextWrapper(width=wrap_count, subsequent_indent=indent)
+        wrapper = _text_wrapper(wrap_count, ' '*(len(cls_name)+1))
         return [' | '+l for l in wrapper.wrap(opt_repr)]
 
     @bothmethod
-    def adjointlayout_info(cls_or_slf, node, siblings, level, value_dims):
+    def adjointlayout_info(cls_or_slf, node, siblings, level, value_dims, option_cache=None):
         first_line = cls_or_slf.component_type(node)
         lines = [(level, first_line)]
         additional_lines = []
-        for component in list(node.data.values()):
-            additional_lines += cls_or_slf.recurse(component, level=level)
+        for component in node.data.values():
+            additional_lines += cls_or_slf.recurse(component, level=level,
+                                                   option_cache=option_cache)
         lines += cls_or_slf.shift(additional_lines, 1)
         return level, lines
 
     @bothmethod
-    def ndmapping_info(cls_or_slf, node, siblings, level, value_dims):
+    def ndmapping_info(cls_or_slf, node, siblings, level, value_dims, option_cache=None):
         key_dim_info = f"[{','.join(d.name for d in node.kdims)}]"
         first_line = cls_or_slf.component_type(node) + cls_or_slf.tab + key_dim_info
         lines = [(level, first_line)]
 
-        opts = cls_or_slf.option_info(node)
-        if cls_or_slf.show_options and opts and opts.kwargs:
-            lines += [(level, l) for l in cls_or_slf.format_options(opts)]
+        if cls_or_slf.show_options:
+            opts = cls_or_slf.option_info(node, option_cache=option_cache)
+            if opts and opts.kwargs:
+                lines += [(level, l) for l in cls_or_slf.format_options(opts)]
 
         if len(node.data) == 0:
             return level, lines
         # .last has different semantics for GridSpace
-        last = list(node.data.values())[-1]
+        last = next(reversed(node.data.values()))
         if last is not None and last._deep_indexable and not hasattr(last, 'children'):
-            level, additional_lines = cls_or_slf.ndmapping_info(last, [], level, value_dims)
+            level, additional_lines = cls_or_slf.ndmapping_info(last, [], level, value_dims,
+                                                                option_cache=option_cache)
         else:
-            additional_lines = cls_or_slf.recurse(last, level=level, value_dims=value_dims)
+            additional_lines = cls_or_slf.recurse(last, level=level, value_dims=value_dims,
+                                                  option_cache=option_cache)
         lines += cls_or_slf.shift(additional_lines, 1)
         return level, lines
 
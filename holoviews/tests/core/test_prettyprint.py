@@ -5,7 +5,7 @@ Test cases for the pretty printing system.
 
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews import Store, Element, Curve, Overlay, Layout
-from holoviews.core.pprint import PrettyPrinter
+from holoviews.core.pprint import InfoPrinter, ParamFilter, PrettyPrinter, _strip_ansi
 
 from .test_dimensioned import CustomBackendTestCase, ExampleElement
 
@@ -26,6 +26,15 @@ class PrettyPrintTest(ComparisonTestCase):
         r = PrettyPrinter.pprint(o)
         self.assertEqual(r, expected)
 
+    def test_nested_layout_repr(self):
+        expected = (':Layout\n   .Value.I  :Overlay\n      .Value.Label :Element\n'
+                    '      .Value.I     :Element\n   .Curve.I  :Curve   [x]   (y)\n'
+                    '   .Value.II :Overlay\n      .Value.I     :Element\n'
+                    '      .Value.Label :Element')
+        layout = (self.element1 * self.element2) + Curve([1,2,3]) + (self.element2 * self.element1)
+        r = PrettyPrinter.pprint(layout)
+        self.assertEqual(r, expected)
+
     def test_curve_pprint_repr(self):
         # Ensure it isn't a bytes object with the 'b' prefix
         expected = "':Curve   [x]   (y)'"
@@ -33,6 +42,48 @@ class PrettyPrintTest(ComparisonTestCase):
         self.assertEqual(repr(r), expected)
 
 
+class ParamFilterTest(ComparisonTestCase):
+
+    def test_filter_all_parameters_returns_object(self):
+        filtered = ParamFilter(Curve, ParamFilter.regexp_filter(''))
+        self.assertIs(filtered, Curve)
+
+    def test_filter_parameters_returns_proxy(self):
+        filtered = ParamFilter(Curve, ParamFilter.regexp_filter('^kdims$'))
+        self.assertIsNot(filtered, Curve)
+        self.assertEqual(set(filtered.param), {'kdims', 'name'})
+
+    def test_filter_all_parameters_instance_returns_proxy(self):
+        curve = Curve([1, 2], group='Foo', label='Bar')
+        filtered = ParamFilter(curve, ParamFilter.regexp_filter(''))
+        self.assertIsNot(filtered, curve)
+        self.assertEqual(filtered.group, 'Curve')
+        self.assertEqual(filtered.label, '')
+
+
+class InfoPrinterTest(ComparisonTestCase):
+
+    def test_collapse_sgr_adjacent_escapes(self):
+        string = '\x1b[1;35mA\x1b[0m\x1b[43;1;30mB\x1b[0m'
+        r = InfoPrinter._collapse_sgr(string)
+        self.assertEqual(r, '\x1b[1;35mA\x1b[0;43;1;30mB\x1b[0m')
+
+    def test_strip_ansi(self):
+        string = '\x1b[1;35mHeading\x1b[0m text \x1b[43;1;30mmatch\x1b[0m'
+        self.assertEqual(_strip_ansi(string), 'Heading text match')
+
+    def test_object_info_with_link(self):
+        r = InfoPrinter.object_info(Layout, 'Layout', backend='bokeh')
+        self.assertEqual(r, '\nOnline example: http://holoviews.org/reference/containers/bokeh/Layout.html'
+                         '\nHelp for the data object: holoviews.help(Layout)'
+                         ' or holoviews.help(<layout_instance>)')
+
+    def test_object_info_without_link(self):
+        r = InfoPrinter.object_info(ExampleElement, 'ExampleElement', backend='bokeh')
+        self.assertEqual(r, '\nHelp for the data object: holoviews.help(ExampleElement)'
+                         ' or holoviews.help(<exampleelement_instance>)')
+
+
 class PrettyPrintOptionsTest(CustomBackendTestCase):
 
     def setUp(self):